@@ -2,15 +2,15 @@ from __future__ import annotations
 
 import math
 import numpy as np
-from scipy.interpolate import splprep, splev
 
 from dataclasses import dataclass
+from functools import cached_property
 from typing import List, Tuple, Optional, Dict
 
 from PyQt6.QtCore import Qt, QPointF, QRectF, QPoint, pyqtSignal, QSizeF
-from PyQt6.QtGui import QPainter, QPen, QPainterPath, QPixmap, QTransform, QAction, QColor, QImage
+from PyQt6.QtGui import QPainter, QPen, QPainterPath, QPixmap, QTransform, QAction, QColor, QImage, QPolygonF
 from PyQt6.QtWidgets import (
-    QGraphicsView, QGraphicsScene, QGraphicsPixmapItem, QGraphicsPathItem,
+    QGraphicsView, QGraphicsScene, QGraphicsItem, QGraphicsPixmapItem, QGraphicsPathItem,
     QApplication, QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QLabel,
     QFileDialog, QMessageBox,
 )
@@ -50,11 +50,27 @@ def polyline_length(points: List[Tuple[float, float]]) -> float:
     """Sum of straight segments; same units as inputs (image px)."""
     if len(points) < 2:
         return 0.0
+    # Plain running total on purpose: builtin sum() rounds differently from 3.12 on, and
+    # crack percentages sit right on the rating boundaries.
     total = 0.0
-    for (x1, y1), (x2, y2) in zip(points, points[1:]):
-        total += math.hypot(x2 - x1, y2 - y1)
+    for d in map(math.dist, points, points[1:]):
+        total += d
     return total
 
+def polyline_distance(points: np.ndarray, x: float, y: float) -> float:
+    """Distance from (x, y) to an open (N, 2) polyline, over all segments at once."""
+    if len(points) < 2:
+        return float("inf")
+    a = points[:-1]
+    d = points[1:] - a
+    rel = np.array((x, y)) - a
+    len2 = np.einsum("ij,ij->i", d, d)
+    # Degenerate segments keep t=0, i.e. distance to their start point
+    t = np.divide(np.einsum("ij,ij->i", rel, d), len2, out=np.zeros_like(len2), where=len2 > 1e-6)
+    np.clip(t, 0.0, 1.0, out=t)
+    off = rel - t[:, None] * d
+    return float(np.sqrt(np.einsum("ij,ij->i", off, off).min()))
+
 # --------- Polyline helpers ---------
 def _perp_dist_to_segment(px: float, py: float,
                         x1: float, y1: float,
@@ -76,6 +92,49 @@ def _perp_dist_to_segment(px: float, py: float,
     projy = y1 + t * vy
     return math.hypot(px - projx, py - projy)
 
+def periodic_cubic_spline(points: List[Tuple[float, float]], n_samples: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Closed C2 cubic through `points`, sampled at `n_samples` evenly spaced parameters in [0, 1].
+
+    Chord-length parametrized, identical to splprep(per=True, s=0) + splev. Like splprep, the last
+    point is replaced by the first to close the loop. Raises ValueError for fewer than 4 points or
+    coincident samples, where splprep also failed.
+    """
+    pts = np.asarray(points, dtype=float)
+    if len(pts) < 4:
+        raise ValueError("periodic spline needs at least 4 points")
+    knots_xy = np.vstack([pts[:-1], pts[:1]])
+    h = np.hypot(*np.diff(knots_xy, axis=0).T)
+    if not np.all(h > 0.0):
+        raise ValueError("coincident spline points")
+    u = np.concatenate(([0.0], np.cumsum(h)))
+    u /= u[-1]
+    h = np.diff(u)
+
+    # Cyclic system for the second derivatives at each knot (M[n] == M[0])
+    n = len(h)
+    idx = np.arange(n)
+    h_prev = np.roll(h, 1)
+    slope = np.diff(knots_xy, axis=0) / h[:, None]
+    A = np.zeros((n, n))
+    A[idx, idx] = 2.0 * (h_prev + h)
+    A[idx, (idx + 1) % n] += h
+    A[idx, (idx - 1) % n] += h_prev
+    M = np.linalg.solve(A, 6.0 * (slope - np.roll(slope, 1, axis=0)))
+    M = np.vstack([M, M[:1]])
+
+    t = np.linspace(0.0, 1.0, n_samples)
+    seg = np.clip(np.searchsorted(u, t, side="right") - 1, 0, n - 1)
+    hs = h[seg][:, None]
+    a = (u[seg + 1] - t)[:, None]
+    b = (t - u[seg])[:, None]
+    y0, y1 = knots_xy[seg], knots_xy[seg + 1]
+    m0, m1 = M[seg], M[seg + 1]
+    out = ((m0 * a ** 3 + m1 * b ** 3) / (6.0 * hs)
+           + (y0 / hs - m0 * hs / 6.0) * a
+           + (y1 / hs - m1 * hs / 6.0) * b)
+    return out[:, 0], out[:, 1]
+
 # --------- Data Models (image-pixel coordinates) ---------
 @dataclass(frozen=True)
 class CrackData:
@@ -84,6 +143,16 @@ class CrackData:
     crack_type: str = "External"
     epsilon_used: float = 1.0
 
+    @cached_property
+    def length_px(self) -> float:
+        """Measured length (simplified polyline, raw as fallback); points are never mutated."""
+        return polyline_length(self.points_simplified or self.points)
+
+    @cached_property
+    def points_array(self) -> np.ndarray:
+        """Measured polyline as an (N, 2) float array for vectorized hit-testing."""
+        return np.array(self.points_simplified or self.points, dtype=float).reshape(-1, 2)
+
 @dataclass(frozen=True)
 class PerimeterData:
     control_points: List[Tuple[float, float]]
@@ -116,6 +185,25 @@ class CoordinateManager:
         y_item = iy * (br.height() / pm.height())
         return image_item.mapToScene(QPointF(x_item, y_item))
 
+    @staticmethod
+    def image_to_scene_polygon(image_pts: List[Tuple[float, float]], image_item: QGraphicsPixmapItem) -> QPolygonF:
+        """Map many image pixel coordinates into scene space with a single transform."""
+        br = image_item.boundingRect()
+        pm = image_item.pixmap()
+        if pm.width() == 0 or pm.height() == 0:
+            return QPolygonF([QPointF() for _ in image_pts])
+        sx = br.width() / pm.width()
+        sy = br.height() / pm.height()
+        return image_item.mapToScene(QPolygonF([QPointF(ix * sx, iy * sy) for ix, iy in image_pts]))
+
+# --------- Transient overlay item ---------
+class AliasedPathItem(QGraphicsPathItem):
+    """Path item painted without antialiasing; for overlays redrawn on every click or mouse move."""
+    def paint(self, painter, option, widget=None):
+        # the scene restores painter state after each item, so this does not leak to other items
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing, False)
+        super().paint(painter, option, widget)
+
 # --------- Scene for items ---------
 class CanvasScene(QGraphicsScene):
     def __init__(self):
@@ -128,6 +216,8 @@ class CanvasScene(QGraphicsScene):
         pen = QPen(Qt.GlobalColor.green, 2)
         pen.setCosmetic(True)
         self.perimeter_item.setPen(pen)
+        # Static while cracks are drawn; cache its rasterized stroke instead of re-stroking each repaint
+        self.perimeter_item.setCacheMode(QGraphicsItem.CacheMode.DeviceCoordinateCache)
         self.addItem(self.perimeter_item)
 
         self.crack_items: List[QGraphicsPathItem] = []
@@ -137,6 +227,8 @@ class CanvasScene(QGraphicsScene):
         if self.image_item is None:
             self.image_item = self.addPixmap(pix)
             self.image_item.setZValue(0)
+            # Repaints under the live crack preview blit the cached view-resolution image
+            self.image_item.setCacheMode(QGraphicsItem.CacheMode.DeviceCoordinateCache)
         else:
             self.image_item.setPixmap(pix)
 
@@ -203,8 +295,22 @@ class CanvasView(QGraphicsView):
         self._perim_ctrl_item: Optional[QGraphicsPathItem] = None
         self._perimeter: Optional[PerimeterData] = None
         self._csd_px: float = 1.0  # avoid div-by-zero; recompute on perimeter changes
+        # Spline vertices plus per-edge terms (edge i runs from vertex i-1 to i) for vectorized point-in-polygon
+        self._perim_x: Optional[np.ndarray] = None
+        self._perim_y: Optional[np.ndarray] = None
+        self._perim_y_prev: Optional[np.ndarray] = None
+        self._perim_edge_den: Optional[np.ndarray] = None  # dy + 1e-12 per edge, fixed until the spline changes
+        self._perim_edge_dx: Optional[np.ndarray] = None
+        self._perim_edge_dy: Optional[np.ndarray] = None
+        self._perim_edge_len2: Optional[np.ndarray] = None
+        self._perim_bbox: Optional[Tuple[float, float, float, float]] = None  # xmin, xmax, ymin, ymax
         self._item_to_crack: Dict[QGraphicsPathItem, CrackData] = {}
         self._auto_preview_min_points: int = 5
+        # Spline sampling: aim for ~2 image px between samples on large O-rings; never fewer
+        # than the original 1000 samples, so CSD and ratings on typical rings are unchanged
+        self._spline_segment_px: float = 2.0
+        self._spline_min_samples: int = 1000
+        self._spline_max_samples: int = 5000
         self._snapshot_long_edge_px: int = 900
 
         self._init_controls_overlay()
@@ -230,8 +336,7 @@ class CanvasView(QGraphicsView):
         self._has_valid_inside_point = False
         self._clear_crack_preview()
         self.clear_overlays()  # optional: full reset
-        self._perimeter = None
-        self._csd_px = 1.0
+        self._reset_perimeter_model()
         return True
 
     def set_mode(self, mode: str):
@@ -251,8 +356,7 @@ class CanvasView(QGraphicsView):
         self._perim_generated = False
 
         # reset perimeter model + csd
-        self._perimeter = None
-        self._csd_px = 1.0
+        self._reset_perimeter_model()
 
         for itm in list(scene.crack_items):
             scene.removeItem(itm)
@@ -304,7 +408,7 @@ class CanvasView(QGraphicsView):
         if scene.image_item is None:
             return
         if self._perim_ctrl_item is None:
-            self._perim_ctrl_item = QGraphicsPathItem()
+            self._perim_ctrl_item = AliasedPathItem()
             self._perim_ctrl_item.setZValue(12)
             pen = QPen(Qt.GlobalColor.red, 1); pen.setCosmetic(True)
             self._perim_ctrl_item.setPen(pen)
@@ -361,7 +465,7 @@ class CanvasView(QGraphicsView):
         # 1) Order clockwise (legacy behavior)
         ordered = self._clockwise_sorted(self._perim_ctrl_img)
 
-        # 2) Drop near-duplicates (~1 px) to avoid splprep failures
+        # 2) Drop near-duplicates (~1 px) to avoid degenerate spline segments
         dedup: List[Tuple[float, float]] = []
         for p in ordered:
             if not dedup or math.hypot(p[0] - dedup[-1][0], p[1] - dedup[-1][1]) >= 1.0:
@@ -370,7 +474,7 @@ class CanvasView(QGraphicsView):
             self._clear_perimeter_loop()
             return False
 
-        # Optional: avoid identical first/last with per=True
+        # Optional: avoid identical first/last for the periodic spline
         if math.hypot(dedup[0][0] - dedup[-1][0], dedup[0][1] - dedup[-1][1]) < 1e-6:
             dedup = dedup[:-1]
             if len(dedup) < 3:
@@ -378,23 +482,17 @@ class CanvasView(QGraphicsView):
                 return False
 
         # 3) Try to build a periodic spline. Fall back to polygon if it fails.
-        spline_img: List[Tuple[float, float]]
         try:
-            x = [pt[0] for pt in dedup]
-            y = [pt[1] for pt in dedup]
-            tck, _ = splprep([x, y], s=0, per=True)
-            sx, sy = splev(np.linspace(0.0, 1.0, 1000), tck)
-            spline_img = list(zip(map(float, sx), map(float, sy)))
+            spline_x, spline_y = periodic_cubic_spline(dedup, self._spline_sample_count(dedup))
         except Exception:
             # Fallback: just use the deduped polygon
-            spline_img = dedup
+            spline_x, spline_y = np.array(dedup, dtype=np.float64).T
+        # The arrays are kept for the geometry caches; tuples only for the model and drawing
+        spline_img = list(zip(spline_x.tolist(), spline_y.tolist()))
 
         # 4) Draw to scene from spline_img (works for both spline and fallback)
         path = QPainterPath()
-        first = CoordinateManager.image_to_scene(spline_img[0], scene.image_item)
-        path.moveTo(first)
-        for px, py in spline_img[1:]:
-            path.lineTo(CoordinateManager.image_to_scene((px, py), scene.image_item))
+        path.addPolygon(CoordinateManager.image_to_scene_polygon(spline_img, scene.image_item))
         path.closeSubpath()
         scene.perimeter_item.setPen(self._perimeter_pen_preview)
         scene.perimeter_item.setPath(path)
@@ -404,12 +502,18 @@ class CanvasView(QGraphicsView):
         #    (use dedup as control points so we don’t persist duplicates)
         self._perim_ctrl_img = dedup
         self._update_perim_ctrl_overlay()
-        self._set_perimeter(ctrl_img=dedup, spline_img=spline_img)
+        self._set_perimeter(ctrl_img=dedup, spline_img=spline_img, spline_xy=(spline_x, spline_y))
 
         # 6) Reclassify cracks against the new perimeter
         self._reclassify_all_cracks()
         return True
 
+    def _spline_sample_count(self, ctrl: List[Tuple[float, float]]) -> int:
+        """Spline samples for a closed loop through `ctrl`, sized from its polygon perimeter."""
+        rough = sum(math.hypot(x2 - x1, y2 - y1) for (x1, y1), (x2, y2) in zip(ctrl, ctrl[1:] + ctrl[:1]))
+        n = int(rough / self._spline_segment_px)
+        return max(self._spline_min_samples, min(self._spline_max_samples, n))
+
     def _clear_perimeter_loop(self):
         scene: CanvasScene = self.scene()  # type: ignore
         scene.perimeter_item.setPath(QPainterPath())
@@ -417,8 +521,7 @@ class CanvasView(QGraphicsView):
         self._perim_generated = False
 
         # reset model copy + csd
-        self._perimeter = None
-        self._csd_px = 1.0
+        self._reset_perimeter_model()
 
         # with no perimeter all cracks are considered internal
         self._reclassify_all_cracks()
@@ -463,21 +566,43 @@ class CanvasView(QGraphicsView):
         self._min_scale = new_min
 
     # ---------- Geometry / helpers ----------
-    def _set_perimeter(self, ctrl_img: List[Tuple[float,float]], spline_img: List[Tuple[float,float]]):
+    def _set_perimeter(self, ctrl_img: List[Tuple[float,float]], spline_img: List[Tuple[float,float]],
+                       spline_xy: Optional[Tuple[np.ndarray, np.ndarray]] = None):
         self._perimeter = PerimeterData(control_points=list(ctrl_img),
                                         spline_points=list(spline_img))
-        # CSD = perimeter_length / pi (in pixels)
+        if spline_xy is None:
+            spline_xy = np.array(spline_img, dtype=np.float64).reshape(-1, 2).T
+        self._perim_x = np.ascontiguousarray(spline_xy[0], dtype=np.float64)
+        self._perim_y = np.ascontiguousarray(spline_xy[1], dtype=np.float64)
+        self._perim_y_prev = np.roll(self._perim_y, 1)
+        edge_dx = np.roll(self._perim_x, 1) - self._perim_x
+        edge_dy = self._perim_y_prev - self._perim_y
+        self._perim_edge_den = edge_dy + 1e-12
+        self._perim_edge_dx, self._perim_edge_dy = edge_dx, edge_dy
+        self._perim_edge_len2 = edge_dx * edge_dx + edge_dy * edge_dy
+        # CSD = perimeter_length / pi (in pixels). Edge i runs from point i-1, so edge 0 is the
+        # closing segment; sum it last with a running total to keep the original rounding.
+        dx, dy = edge_dx.tolist(), edge_dy.tolist()
         per_len = 0.0
-        for (x1,y1),(x2,y2) in zip(spline_img, spline_img[1:]):
-            per_len += math.hypot(x2-x1, y2-y1)
-        per_len += math.hypot(spline_img[0][0]-spline_img[-1][0], spline_img[0][1]-spline_img[-1][1])
+        for d in map(math.hypot, dx[1:] + dx[:1], dy[1:] + dy[:1]):
+            per_len += d
         self._csd_px = (per_len / math.pi) if per_len > 0 else 1.0
+        self._perim_bbox = (float(self._perim_x.min()), float(self._perim_x.max()),
+                            float(self._perim_y.min()), float(self._perim_y.max()))
         self.perimeterUpdated.emit()
+
+    def _reset_perimeter_model(self):
+        self._perimeter = None
+        self._csd_px = 1.0
+        self._perim_x = self._perim_y = None
+        self._perim_y_prev = self._perim_edge_den = None
+        self._perim_edge_dx = self._perim_edge_dy = self._perim_edge_len2 = None
+        self._perim_bbox = None
     
     def _ensure_crack_preview(self):
         if self._crack_preview_item is None:
             scene: CanvasScene = self.scene()  # type: ignore
-            self._crack_preview_item = QGraphicsPathItem()
+            self._crack_preview_item = AliasedPathItem()
             self._crack_preview_item.setZValue(15)
             pen = QPen(self._default_crack_pen)
             pen.setCosmetic(True)
@@ -520,6 +645,16 @@ class CanvasView(QGraphicsView):
         return list(self._extract_points_from_path(scene.perimeter_item, scene.image_item))
 
     def is_within_perimeter_img(self, img_xy: Tuple[float, float]) -> bool:
+        if self._perim_x is not None and len(self._perim_x) >= 3:
+            # Same even-odd ray cast as below, over all edges at once, in the same operand order
+            x, y = img_xy
+            xmin, xmax, ymin, ymax = self._perim_bbox
+            if x < xmin or x > xmax or y < ymin or y > ymax:
+                return False
+            ys = self._perim_y
+            crosses = (ys > y) != (self._perim_y_prev > y)
+            x_hits = self._perim_edge_dx * (y - ys) / self._perim_edge_den + self._perim_x
+            return bool(np.count_nonzero(crosses & (x < x_hits)) & 1)
         pts = self._perimeter_points_img()
         if len(pts) < 3: return True
         x, y = img_xy; inside = False; j = len(pts) - 1
@@ -531,6 +666,13 @@ class CanvasView(QGraphicsView):
         return inside
 
     def snap_to_perimeter_img(self, img_xy: Tuple[float, float], threshold_px: float = 5.0) -> Tuple[float, float]:
+        if self._perim_x is not None and len(self._perim_x) >= 3:
+            x, y = img_xy
+            d2 = (self._perim_x - x) ** 2 + (self._perim_y - y) ** 2
+            i = int(d2.argmin())
+            if d2[i] <= threshold_px * threshold_px:
+                return self._perimeter.spline_points[i]
+            return img_xy
         pts = self._perimeter_points_img()
         if len(pts) < 3: return img_xy
         x, y = img_xy; best = None; best_d2 = threshold_px * threshold_px
@@ -550,9 +692,7 @@ class CanvasView(QGraphicsView):
         scene: CanvasScene = self.scene()  # type: ignore
         p = QPainterPath()
         if not img_pts or scene.image_item is None: return p
-        p.moveTo(CoordinateManager.image_to_scene(img_pts[0], scene.image_item))
-        for ipt in img_pts[1:]:
-            p.lineTo(CoordinateManager.image_to_scene(ipt, scene.image_item))
+        p.addPolygon(CoordinateManager.image_to_scene_polygon(img_pts, scene.image_item))
         return p
 
     def _delete_crack_near_scene_point(self, scene_pt: QPointF, tol_scene_px: float = 14.0) -> bool:
@@ -560,12 +700,24 @@ class CanvasView(QGraphicsView):
         if scene.image_item is None:
             return False
 
+        # Hit-test in image pixels against each crack's cached point array
+        ix, iy = CoordinateManager.scene_to_image(scene_pt, scene.image_item)
+        pm_w = scene.image_item.pixmap().width()
+        scene_per_img = scene.image_item.boundingRect().width() / pm_w if pm_w else 1.0
+
         best_item: Optional[QGraphicsPathItem] = None
         best_dist = tol_scene_px
+        # The scene's BSP index returns only items whose bounds come within tolerance of the click
+        probe = QRectF(scene_pt.x() - tol_scene_px, scene_pt.y() - tol_scene_px,
+                       2 * tol_scene_px, 2 * tol_scene_px)
+        nearby = set(scene.items(probe, Qt.ItemSelectionMode.IntersectsItemBoundingRect))
         for item in list(scene.crack_items):
-            path = item.path()
-            pts = [QPointF(path.elementAt(i).x, path.elementAt(i).y) for i in range(path.elementCount())]
-            dist = self._scene_dist_to_polyline(scene_pt, pts)
+            if item not in nearby:
+                continue
+            crack = self._item_to_crack.get(item)
+            if crack is None:
+                continue
+            dist = polyline_distance(crack.points_array, ix, iy) * scene_per_img
             if dist <= best_dist:
                 best_dist = dist
                 best_item = item
@@ -606,56 +758,28 @@ class CanvasView(QGraphicsView):
                 self._set_crack_pen(item, crack.crack_type)
         self._item_to_crack = {item: crack for item, crack in zip(scene.crack_items, self._cracks)} if scene else {}
 
-    def _dist_to_polyline(self, pt: Tuple[float,float], poly: List[Tuple[float,float]]) -> float:
-        x,y = pt
-        best = float("inf")
-        for (x1,y1),(x2,y2) in zip(poly, poly[1:]+poly[:1]):  # closed
-            vx, vy = x2-x1, y2-y1
-            if vx==vy==0: 
-                d = math.hypot(x-x1, y-y1)
-            else:
-                t = max(0.0, min(1.0, ((x-x1)*vx + (y-y1)*vy) / (vx*vx + vy*vy)))
-                px, py = x1 + t*vx, y1 + t*vy
-                d = math.hypot(x-px, y-py)
-            best = min(best, d)
-        return best
-
-    def _scene_dist_to_polyline(self, pt: QPointF, poly: List[QPointF]) -> float:
-        if len(poly) < 2:
-            return float("inf")
-        best = float("inf")
-        for a, b in zip(poly, poly[1:]):
-            d = self._scene_dist_to_segment(pt, a, b)
-            if d < best:
-                best = d
-        return best
-
-    @staticmethod
-    def _scene_dist_to_segment(p: QPointF, a: QPointF, b: QPointF) -> float:
-        ax, ay = a.x(), a.y()
-        bx, by = b.x(), b.y()
-        px, py = p.x(), p.y()
-        vx, vy = bx - ax, by - ay
-        seg_len2 = vx * vx + vy * vy
-        if seg_len2 <= 1e-6:
-            return math.hypot(px - ax, py - ay)
-        t = max(0.0, min(1.0, ((px - ax) * vx + (py - ay) * vy) / seg_len2))
-        proj_x = ax + t * vx
-        proj_y = ay + t * vy
-        return math.hypot(px - proj_x, py - proj_y)
+    def _dist_to_perimeter(self, pt: Tuple[float,float]) -> float:
+        """Distance from an image point to the closed spline, over all cached edges at once."""
+        x, y = pt
+        rel_x = x - self._perim_x
+        rel_y = y - self._perim_y
+        len2 = self._perim_edge_len2
+        # Zero-length edges (duplicate spline samples) keep t=0, i.e. distance to the vertex
+        t = np.divide(rel_x * self._perim_edge_dx + rel_y * self._perim_edge_dy, len2,
+                      out=np.zeros_like(len2), where=len2 > 0)
+        np.clip(t, 0.0, 1.0, out=t)
+        return float(np.hypot(rel_x - t * self._perim_edge_dx, rel_y - t * self._perim_edge_dy).min())
 
     def _endpoint_on_perimeter(self, p: Tuple[float,float], eps_px: float = 3.0) -> bool:
         if not self._perimeter or len(self._perimeter.spline_points) < 3:
             return False
-        return self._dist_to_polyline(p, self._perimeter.spline_points) <= eps_px
+        return self._dist_to_perimeter(p) <= eps_px
 
     def engine_inputs(self):
         """Return (csd_px, [(type, length_pct), ...]) for rating engine."""
         out = []
         for c in self._cracks:
-            pts = self._pts_for_measure(c)
-            L = polyline_length(pts)
-            pct = (L / self._csd_px) * 100.0 if self._csd_px > 0 else 0.0
+            pct = (c.length_px / self._csd_px) * 100.0 if self._csd_px > 0 else 0.0
             out.append((c.crack_type, pct))
         return self._csd_px, out
 
@@ -765,8 +889,9 @@ class CanvasView(QGraphicsView):
                     self._current_crack_img = [img_xy]
                 else:
                     lx, ly = self._current_crack_img[-1]
-                    if math.hypot(img_xy[0]-lx, img_xy[1]-ly) >= MIN_STEP:
-                        self._current_crack_img.append(img_xy)
+                    if math.hypot(img_xy[0]-lx, img_xy[1]-ly) < MIN_STEP:
+                        return  # no new point, so the preview is unchanged
+                    self._current_crack_img.append(img_xy)
 
                 # show live path
                 self._update_crack_preview()
@@ -1,13 +1,14 @@
 import os
 import sys
 import datetime
-import tempfile
 import json
 import argparse
-from typing import List, Optional, Tuple, Literal, cast
+from contextlib import contextmanager
+from io import BytesIO
+from typing import TYPE_CHECKING, Dict, Iterator, List, Optional, Tuple, Literal, cast
 
-from PyQt6.QtCore import Qt, QRegularExpression, QItemSelectionModel
-from PyQt6.QtGui import QRegularExpressionValidator, QPixmap
+from PyQt6.QtCore import Qt, QRegularExpression, QItemSelectionModel, QBuffer, QIODevice
+from PyQt6.QtGui import QBrush, QRegularExpressionValidator, QPixmap
 from PyQt6.QtWidgets import (
     QApplication,
     QMainWindow,
@@ -35,12 +36,12 @@ from PyQt6.QtWidgets import (
     QCheckBox,
 )
 
-from openpyxl import Workbook
-from openpyxl.drawing.image import Image
-from openpyxl.utils import get_column_letter
-from openpyxl.worksheet.worksheet import Worksheet
+# openpyxl is only needed for report export; it is imported there to keep it off the start-up path.
+if TYPE_CHECKING:
+    from openpyxl import Workbook
+    from openpyxl.worksheet.worksheet import Worksheet
 
-from rating import compute_metrics, table_values, assign_iso23936_rating, Crack
+from rating import compute_metrics, table_values, assign_rating_from_metrics, Crack
 
 from canvas_gv import CanvasScene, CanvasView
 from session_store import (
@@ -147,10 +148,31 @@ RATING_THRESHOLDS = {
 
 RATING_HEADER_LABELS = ["Metric", "Value"] + list(RATING_THRESHOLDS.keys())
 
+SESSION_TABLE_HEADERS = ["#", "Image", "Completed", "Cracks", "Total % CSD", "Rating", "Result"]
+
+# (background, foreground) cell brushes, built once and shared by every table refresh
+RESULT_BRUSHES = {
+    "Pass": (QBrush(Qt.GlobalColor.green), QBrush(Qt.GlobalColor.black)),
+    "Fail": (QBrush(Qt.GlobalColor.red), QBrush(Qt.GlobalColor.white)),
+}
+THRESHOLD_HIGHLIGHT_BRUSHES = (QBrush(Qt.GlobalColor.yellow), QBrush(Qt.GlobalColor.black))
+
 
 WINDOW_TITLE_BASE = f"oRinGD - ISO23936-2 Annex B Analyzer (v{APP_VERSION})"
 
 
+@contextmanager
+def batched_table_updates(table: QTableWidget) -> Iterator[QTableWidget]:
+    """Suspend repaints and signals while filling `table`; re-enabling updates repaints it once."""
+    table.setUpdatesEnabled(False)
+    table.blockSignals(True)
+    try:
+        yield table
+    finally:
+        table.blockSignals(False)
+        table.setUpdatesEnabled(True)
+
+
 class NewSessionDialog(QDialog):
     def __init__(self, parent: Optional[QWidget] = None):
         super().__init__(parent)
@@ -286,10 +308,8 @@ def bootstrap_session(parent: Optional[QWidget] = None) -> Optional[SessionState
 
 class MainWindow(QMainWindow):
     def __init__(self, session_state: SessionState, debug_layout: bool = False):
-        window_size = DEFAULT_LAYOUT["window"]["size"]
         super().__init__()
         self.setWindowTitle(WINDOW_TITLE_BASE)
-        self.resize(window_size[0], window_size[1])
         self.setMinimumSize(1000, 720)
 
         self.current_image_path: Optional[str] = None
@@ -301,6 +321,11 @@ class MainWindow(QMainWindow):
         self.session_file_path: Optional[str] = session_state.file_path
         self.debug_layout = debug_layout
         self.settings_path = os.path.join(os.path.dirname(__file__), "layout_prefs.json")
+        self._last_table_cracks: Optional[List[Crack]] = None
+        # Rating table value cells and row lookup, filled in by initialize_rating_table()
+        self._value_items: List[QTableWidgetItem] = []
+        self._rating_row_index: Dict[str, int] = {}
+        self._highlighted_rating_col: Optional[int] = None
 
         central = QWidget()
         self.setCentralWidget(central)
@@ -429,8 +454,6 @@ class MainWindow(QMainWindow):
 
         self.view.perimeterUpdated.connect(self.refresh_tables)
         self.view.cracksUpdated.connect(self.refresh_tables)
-        self.view.perimeterUpdated.connect(self.update_action_states)
-        self.view.cracksUpdated.connect(self.update_action_states)
         self.view.modeChanged.connect(self.on_mode_changed)
         self.view.analysisFinalizeRequested.connect(self.finalize_current_analysis)
 
@@ -453,14 +476,17 @@ class MainWindow(QMainWindow):
             self._has_shown_crack_prompt = True
 
     def refresh_tables(self):
-        self.update_crack_table()
-        self.update_rating_table()
+        # Perimeter and crack signals often fire together; only rebuild when the inputs moved.
+        _, cracks = self.view.engine_inputs()
+        if cracks != self._last_table_cracks:
+            self._last_table_cracks = cracks
+            self.update_crack_table(cracks)
+            self.update_rating_table(cracks)
         self.update_action_states()
 
     def initialize_session_table(self):
-        headers = ["#", "Image", "Completed", "Cracks", "Total % CSD", "Rating", "Result"]
-        self.session_table_widget.setColumnCount(len(headers))
-        self.session_table_widget.setHorizontalHeaderLabels(headers)
+        self.session_table_widget.setColumnCount(len(SESSION_TABLE_HEADERS))
+        self.session_table_widget.setHorizontalHeaderLabels(SESSION_TABLE_HEADERS)
         sess_vheader = self.session_table_widget.verticalHeader()
         if sess_vheader:
             sess_vheader.setVisible(False)
@@ -489,6 +515,11 @@ class MainWindow(QMainWindow):
                 record.result,
             ]
             for col, text in enumerate(values):
+                # Existing rows keep their items; only the text is refreshed.
+                item = self.session_table_widget.item(row, col)
+                if item is not None:
+                    item.setText(text)
+                    continue
                 item = QTableWidgetItem(text)
                 item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
                 if col == 1:
@@ -497,12 +528,9 @@ class MainWindow(QMainWindow):
 
             result_item = self.session_table_widget.item(row, 6)
             if result_item:
-                if record.result == "Pass":
-                    result_item.setBackground(Qt.GlobalColor.green)
-                    result_item.setForeground(Qt.GlobalColor.black)
-                else:
-                    result_item.setBackground(Qt.GlobalColor.red)
-                    result_item.setForeground(Qt.GlobalColor.white)
+                background, foreground = RESULT_BRUSHES["Pass" if record.result == "Pass" else "Fail"]
+                result_item.setBackground(background)
+                result_item.setForeground(foreground)
 
         self.session_table_widget.resizeRowsToContents()
 
@@ -714,20 +742,20 @@ class MainWindow(QMainWindow):
             else:
                 raise
 
-    def update_crack_table(self):
-        _, cracks = self.view.engine_inputs()
-        self.crack_table_widget.setRowCount(len(cracks))
-        for row, (crack_type, percent_length) in enumerate(cracks):
-            number_item = QTableWidgetItem(str(row + 1))
-            number_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            type_item = QTableWidgetItem(crack_type)
-            type_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            length_item = QTableWidgetItem(f"{percent_length:.2f}%")
-            length_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-
-            self.crack_table_widget.setItem(row, 0, number_item)
-            self.crack_table_widget.setItem(row, 1, type_item)
-            self.crack_table_widget.setItem(row, 2, length_item)
+    def update_crack_table(self, cracks: List[Crack]):
+        # setRowCount drops rows from the end; surviving items are reused and only re-texted.
+        with batched_table_updates(self.crack_table_widget) as table:
+            table.setRowCount(len(cracks))
+            for row, (crack_type, percent_length) in enumerate(cracks):
+                texts = (str(row + 1), crack_type, f"{percent_length:.2f}%")
+                for col, text in enumerate(texts):
+                    item = table.item(row, col)
+                    if item is None:
+                        item = QTableWidgetItem(text)
+                        item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
+                        table.setItem(row, col, item)
+                    else:
+                        item.setText(text)
 
     def initialize_rating_table(self):
         self.rating_table_widget.setRowCount(len(RATING_METRICS))
@@ -743,58 +771,66 @@ class MainWindow(QMainWindow):
             header.setSectionResizeMode(1, QHeaderView.ResizeMode.Stretch)
         self.rating_table_widget.setColumnWidth(0, 275)
 
-        for row, metric in enumerate(RATING_METRICS):
-            self.rating_table_widget.setItem(row, 0, QTableWidgetItem(metric))
-            for col, threshold_key in enumerate(RATING_THRESHOLDS.keys(), start=2):
-                self.rating_table_widget.setColumnWidth(col, 90)
-                threshold_item = QTableWidgetItem(RATING_THRESHOLDS[threshold_key][row])
-                threshold_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-                self.rating_table_widget.setItem(row, col, threshold_item)
-
-    def update_rating_table(self) -> None:
+        threshold_cols = list(enumerate(RATING_THRESHOLDS.values(), start=2))
+        for col, _ in threshold_cols:
+            self.rating_table_widget.setColumnWidth(col, 90)
+
+        # Value cells are created once and only have their text/colors updated afterwards.
+        self._value_items.clear()
+        self._rating_row_index.clear()
+        self._highlighted_rating_col = None
+        with batched_table_updates(self.rating_table_widget) as table:
+            for row, metric in enumerate(RATING_METRICS):
+                self._rating_row_index[metric] = row
+                table.setItem(row, 0, QTableWidgetItem(metric))
+                value_item = QTableWidgetItem("")
+                value_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
+                table.setItem(row, 1, value_item)
+                self._value_items.append(value_item)
+                for col, column_values in threshold_cols:
+                    threshold_item = QTableWidgetItem(column_values[row])
+                    threshold_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
+                    table.setItem(row, col, threshold_item)
+
+    def update_rating_table(self, cracks: List[Crack]) -> None:
         if self.rating_table_widget.rowCount() == 0:
             self.initialize_rating_table()
 
-        _, cracks = self.view.engine_inputs()
-        metrics = compute_metrics(cracks)
-        assigned_rating = assign_iso23936_rating(cracks)
-        values = table_values(metrics)
-
-        for row, text in enumerate(values):
-            item = QTableWidgetItem(text)
-            item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            self.rating_table_widget.setItem(row, 1, item)
-
-        for col in range(2, 7):
-            for row in range(10):
-                cell = self.rating_table_widget.item(row, col)
-                if not cell:
-                    continue
-                if col == assigned_rating + 1:
-                    cell.setBackground(Qt.GlobalColor.yellow)
-                    cell.setForeground(Qt.GlobalColor.black)
-                else:
-                    cell.setData(Qt.ItemDataRole.BackgroundRole, None)
-                    cell.setData(Qt.ItemDataRole.ForegroundRole, None)
-
-        overall_row = 10
-        overall_eval = "Pass" if assigned_rating <= 3 else "Fail"
-        overall_text = f"Rating: {assigned_rating} - {overall_eval}"
-
-        overall_item = QTableWidgetItem(overall_text)
-        overall_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.rating_table_widget.setItem(overall_row, 1, overall_item)
-
-        if overall_eval == "Pass":
-            overall_item.setBackground(Qt.GlobalColor.green)
-            overall_item.setForeground(Qt.GlobalColor.black)
-        else:
-            overall_item.setBackground(Qt.GlobalColor.red)
-            overall_item.setForeground(Qt.GlobalColor.white)
-
-        viewport = self.rating_table_widget.viewport()
-        if viewport:
-            viewport.update()
+        with batched_table_updates(self.rating_table_widget) as table:
+            metrics = compute_metrics(cracks)
+            assigned_rating = assign_rating_from_metrics(metrics)
+            values = table_values(metrics)
+
+            for row, text in enumerate(values):
+                self._value_items[row].setText(text)
+
+            overall_row = self._rating_row_index["OVERALL RATING"]
+
+            # Only repaint threshold cells when the rating column actually moves.
+            highlight_col = assigned_rating + 1 if 2 <= assigned_rating + 1 <= 6 else None
+            if highlight_col != self._highlighted_rating_col:
+                for row in range(overall_row):
+                    if self._highlighted_rating_col is not None:
+                        cell = table.item(row, self._highlighted_rating_col)
+                        if cell:
+                            cell.setData(Qt.ItemDataRole.BackgroundRole, None)
+                            cell.setData(Qt.ItemDataRole.ForegroundRole, None)
+                    if highlight_col is not None:
+                        cell = table.item(row, highlight_col)
+                        if cell:
+                            cell.setBackground(THRESHOLD_HIGHLIGHT_BRUSHES[0])
+                            cell.setForeground(THRESHOLD_HIGHLIGHT_BRUSHES[1])
+                self._highlighted_rating_col = highlight_col
+
+            overall_eval = "Pass" if assigned_rating <= 3 else "Fail"
+            overall_text = f"Rating: {assigned_rating} - {overall_eval}"
+
+            overall_item = self._value_items[overall_row]
+            overall_item.setText(overall_text)
+
+            background, foreground = RESULT_BRUSHES[overall_eval]
+            overall_item.setBackground(background)
+            overall_item.setForeground(foreground)
 
     def select_image(self):
         if self.current_image_path and self.has_active_analysis_data():
@@ -836,7 +872,7 @@ class MainWindow(QMainWindow):
 
         _, cracks = self.view.engine_inputs()
         metrics = compute_metrics(cracks)
-        rating = assign_iso23936_rating(cracks)
+        rating = assign_rating_from_metrics(metrics)
         result = "Pass" if rating <= 3 else "Fail"
         next_action = self._prompt_post_finalize_action(rating, result)
         if next_action == "continue":
@@ -861,7 +897,6 @@ class MainWindow(QMainWindow):
             self.view.set_mode('draw_perimeter')
             self._has_shown_crack_prompt = False
             self.refresh_tables()
-            self.update_action_states()
 
     def saveCanvas(self, file_path: Optional[str] = None, suppress_conf: bool = False):
         if not file_path:
@@ -903,15 +938,12 @@ class MainWindow(QMainWindow):
             if pixmap.isNull():
                 return None
 
-            with tempfile.NamedTemporaryFile(suffix=".png", delete=False) as tmp:
-                temp_path = tmp.name
-            if not pixmap.save(temp_path, "PNG"):
-                os.remove(temp_path)
+            buffer = QBuffer()
+            if not buffer.open(QIODevice.OpenModeFlag.WriteOnly):
+                return None
+            if not pixmap.save(buffer, "PNG"):
                 return None
-            with open(temp_path, "rb") as fp:
-                data = fp.read()
-            os.remove(temp_path)
-            return data
+            return bytes(buffer.data())
         except Exception:
             return None
         finally:
@@ -971,7 +1003,6 @@ class MainWindow(QMainWindow):
         self.view.clear_overlays()
         self.current_image_path = None
         self.refresh_tables()
-        self.update_action_states()
         self.persist_session()
 
         return record
@@ -995,60 +1026,52 @@ class MainWindow(QMainWindow):
         if not file_path:
             return
 
+        from openpyxl import Workbook
+
         workbook = Workbook()
-        summary_sheet = cast(Optional[Worksheet], workbook.active)
+        summary_sheet = cast(Optional["Worksheet"], workbook.active)
         if summary_sheet is None:
             summary_sheet = workbook.create_sheet("Session Summary")
         else:
             summary_sheet.title = "Session Summary"
         self._populate_session_summary_sheet(summary_sheet)
 
-        temp_image_paths: List[str] = []
+        for record in self.session_records:
+            self._add_analysis_sheet(workbook, record)
 
-        try:
-            for record in self.session_records:
-                snapshot_path = None
-                if record.snapshot_png:
-                    with tempfile.NamedTemporaryFile(suffix=".png", delete=False) as tmp:
-                        tmp.write(record.snapshot_png)
-                        snapshot_path = tmp.name
-                    temp_image_paths.append(snapshot_path)
-                self._add_analysis_sheet(workbook, record, snapshot_path)
-
-            workbook.save(file_path)
-            QMessageBox.information(self, "Success", f"Report saved to {file_path}")
-        finally:
-            for tmp_path in temp_image_paths:
-                if tmp_path and os.path.exists(tmp_path):
-                    os.remove(tmp_path)
+        workbook.save(file_path)
+        QMessageBox.information(self, "Success", f"Report saved to {file_path}")
 
     def _populate_session_summary_sheet(self, sheet):
+        from openpyxl.utils import get_column_letter
+
         sheet["A1"] = "Completed Analyses"
-        headers = ["#", "Image", "Completed", "Cracks", "Total % CSD", "Rating", "Result"]
-        for idx, header in enumerate(headers, start=1):
-            sheet.cell(row=2, column=idx, value=header)
-
-        for offset, record in enumerate(self.session_records, start=1):
-            row_idx = 2 + offset
-            sheet.cell(row=row_idx, column=1, value=record.index)
-            sheet.cell(row=row_idx, column=2, value=record.image_name)
-            sheet.cell(row=row_idx, column=3, value=record.completed_at.strftime("%Y-%m-%d %H:%M:%S"))
-            sheet.cell(row=row_idx, column=4, value=record.crack_count)
-            sheet.cell(row=row_idx, column=5, value=f"{record.total_pct:.2f}%")
-            sheet.cell(row=row_idx, column=6, value=record.rating)
-            sheet.cell(row=row_idx, column=7, value=record.result)
+        sheet.append(SESSION_TABLE_HEADERS)
+        for record in self.session_records:
+            sheet.append([
+                record.index,
+                record.image_name,
+                record.completed_at.strftime("%Y-%m-%d %H:%M:%S"),
+                record.crack_count,
+                f"{record.total_pct:.2f}%",
+                record.rating,
+                record.result,
+            ])
 
         analytics_widths = [6, 28, 20, 10, 14, 10, 10]
         for idx, width in enumerate(analytics_widths, start=1):
             sheet.column_dimensions[get_column_letter(idx)].width = width
 
-    def _add_analysis_sheet(self, workbook: Workbook, record: SessionAnalysis, snapshot_path: Optional[str]):
+    def _add_analysis_sheet(self, workbook: "Workbook", record: SessionAnalysis):
         base_title = f"{record.index:02d} - {os.path.splitext(record.image_name)[0]}"
         sheet_title = self._make_unique_sheet_title(workbook, base_title)
         sheet = workbook.create_sheet(sheet_title)
 
-        if snapshot_path and os.path.exists(snapshot_path):
-            excel_image = Image(snapshot_path)
+        if record.snapshot_png:
+            from openpyxl.drawing.image import Image
+
+            # openpyxl reads the stream when the workbook is saved, so no temp file is needed.
+            excel_image = Image(BytesIO(record.snapshot_png))
             sheet.add_image(excel_image, "A1")
 
         metadata = [
@@ -1072,7 +1095,7 @@ class MainWindow(QMainWindow):
         self._write_rating_table_to_sheet(sheet, record, start_row=rating_start_row, start_col=15)
         self._write_crack_table_to_sheet(sheet, record, start_row=crack_table_start_row, start_col=15)
 
-    def _make_unique_sheet_title(self, workbook: Workbook, base_title: str) -> str:
+    def _make_unique_sheet_title(self, workbook: "Workbook", base_title: str) -> str:
         invalid_chars = set('[]:*?/\\')
         sanitized = ''.join('_' if c in invalid_chars else c for c in base_title).strip()
         sanitized = sanitized or "Analysis"
@@ -1091,6 +1114,8 @@ class MainWindow(QMainWindow):
             suffix += 1
 
     def _write_rating_table_to_sheet(self, sheet, record: SessionAnalysis, start_row: int = 2, start_col: int = 12):
+        from openpyxl.utils import get_column_letter
+
         header_row = start_row
         for offset, header in enumerate(RATING_HEADER_LABELS):
             sheet.cell(row=header_row, column=start_col + offset, value=header)
@@ -1167,24 +1192,23 @@ class MainWindow(QMainWindow):
         info.append(f"Number of cracks: {len(cracks)}")
         info.append("")
 
+        # Counters come from the same single pass the rating engine uses; the displayed
+        # total still includes split lengths as before.
+        metrics = compute_metrics(cracks)
         total_length_percent = sum(length for _, length in cracks)
-        internal_lengths = [length for ctype, length in cracks if ctype == "Internal"]
-        external_lengths = [length for ctype, length in cracks if ctype == "External"]
-        has_split = any(ctype == "Split" for ctype, _ in cracks)
-
         for idx, (ctype, length) in enumerate(cracks, start=1):
             info.append(f"Crack {idx}: {ctype}, {length:.2f}% CSD")
+        has_split = metrics.has_split
+        num_measured = len(metrics.internal_pct) + len(metrics.external_pct)
 
         info.append("")
         info.append("DETAILED METRICS FOR RATING DETERMINATION:")
         info.append("-" * 40)
 
-        all_crack_lengths = internal_lengths + external_lengths
-
         info.append("Rating 1 Requirements:")
-        all_below_25 = all(length < 25 for length in all_crack_lengths) if all_crack_lengths else True
-        all_ext_below_10 = all(length < 10 for length in external_lengths) if external_lengths else True
-        num_at_or_above_25 = sum(1 for length in all_crack_lengths if length >= 25)
+        all_below_25 = metrics.num_lt25 == num_measured
+        all_ext_below_10 = metrics.all_ext_lt10
+        num_at_or_above_25 = num_measured - metrics.num_lt25
         info.append(f"  Total length ≤100%: {total_length_percent:.2f}% ({'✓' if total_length_percent <= 100 else '✗'})")
         info.append(f"  All cracks <25%: {'✓' if all_below_25 else '✗'}")
         if not all_below_25:
@@ -1192,9 +1216,9 @@ class MainWindow(QMainWindow):
         info.append(f"  All external <10%: {'✓' if all_ext_below_10 else '✗'}")
 
         info.append("\nRating 2 Requirements:")
-        all_below_50 = all(length < 50 for length in all_crack_lengths) if all_crack_lengths else True
-        all_ext_below_25 = all(length < 25 for length in external_lengths) if external_lengths else True
-        num_at_or_above_50 = sum(1 for length in all_crack_lengths if length >= 50)
+        all_below_50 = metrics.num_lt50 == num_measured
+        all_ext_below_25 = metrics.all_ext_lt25
+        num_at_or_above_50 = num_measured - metrics.num_lt50
         info.append(f"  Total length ≤200%: {total_length_percent:.2f}% ({'✓' if total_length_percent <= 200 else '✗'})")
         info.append(f"  All cracks <50%: {'✓' if all_below_50 else '✗'}")
         if not all_below_50:
@@ -1202,16 +1226,16 @@ class MainWindow(QMainWindow):
         info.append(f"  All external <25%: {'✓' if all_ext_below_25 else '✗'}")
 
         info.append("\nRating 3 Requirements:")
-        internal_50_80_count = sum(1 for length in internal_lengths if 50 <= length <= 80)
-        all_ext_below_50 = all(length < 50 for length in external_lengths) if external_lengths else True
+        internal_50_80_count = metrics.internal_50_80_count
+        all_ext_below_50 = metrics.all_ext_lt50
         info.append(f"  Total length ≤300%: {total_length_percent:.2f}% ({'✓' if total_length_percent <= 300 else '✗'})")
         info.append(f"  ≤2 internal cracks 50-80%: {internal_50_80_count} ({'✓' if internal_50_80_count <= 2 else '✗'})")
         info.append(f"  All external <50%: {'✓' if all_ext_below_50 else '✗'}")
 
         info.append("\nRating 4 Triggers (any one triggers failure):")
-        internal_above_80_count = sum(1 for length in internal_lengths if length > 80)
-        internal_above_50_count = sum(1 for length in internal_lengths if length > 50)
-        any_ext_above_50 = any(length > 50 for length in external_lengths) if external_lengths else False
+        internal_above_80_count = metrics.internal_above_80
+        internal_above_50_count = metrics.internal_above_50
+        any_ext_above_50 = any(length > 50 for length in metrics.external_pct)
         info.append(f"  Total >300%: {'✗' if total_length_percent > 300 else '✓'}")
         info.append(f"  ≥1 internal >80%: {internal_above_80_count} ({'✗' if internal_above_80_count >= 1 else '✓'})")
         info.append(f"  ≥3 internals >50%: {internal_above_50_count} ({'✗' if internal_above_50_count >= 3 else '✓'})")
@@ -1,9 +1,13 @@
 # rating.py
+import logging
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import List, Tuple
 
 Crack = Tuple[str, float]  # ("Internal"|"External"|"Split", percent of CSD)
 
+log = logging.getLogger(__name__)
+
 @dataclass(frozen=True)
 class Metrics:
     # raw inputs summarized
@@ -23,7 +27,18 @@ class Metrics:
     internal_above_50: int
     has_three_internal_above_50: bool
 
-def compute_metrics(cracks: List[Crack], debug: bool = False) -> Metrics:
+    @property
+    def rating_key(self) -> Tuple:
+        """Hashable summary of every field the rating rules read."""
+        return (
+            self.num_cracks, self.total_pct, self.has_split,
+            self.num_lt25, self.num_lt50,
+            self.all_ext_lt10, self.all_ext_lt25, self.all_ext_lt50,
+            self.internal_50_80_count, self.internal_above_80,
+            self.has_three_internal_above_50,
+        )
+
+def compute_metrics(cracks: List[Crack]) -> Metrics:
     if not cracks:
         return Metrics(
             num_cracks=0, total_pct=0.0,
@@ -34,33 +49,52 @@ def compute_metrics(cracks: List[Crack], debug: bool = False) -> Metrics:
             internal_above_50=0, has_three_internal_above_50=False
         )
 
-    internal = [p for (t, p) in cracks if t == "Internal"]
-    external = [p for (t, p) in cracks if t == "External"]
-    has_split = any(t == "Split" for t, _ in cracks)
-    allp = internal + external
-    total = sum(allp)
-
-    num_lt25 = sum(1 for p in allp if p < 25)
-    num_lt50 = sum(1 for p in allp if p < 50)
-
-    all_ext_lt10 = all(p < 10 for p in external) if external else True
-    all_ext_lt25 = all(p < 25 for p in external) if external else True
-    all_ext_lt50 = all(p < 50 for p in external) if external else True
-
-    internal_50_80_count = sum(1 for p in internal if 50 <= p <= 80)
-    internal_above_80 = sum(1 for p in internal if p > 80)
-    internal_above_50 = sum(1 for p in internal if p > 50)
+    # One pass over the cracks gathers every counter the rules and table need.
+    internal: List[float] = []
+    external: List[float] = []
+    has_split = False
+    num_lt25 = num_lt50 = 0
+    all_ext_lt10 = all_ext_lt25 = all_ext_lt50 = True
+    internal_50_80_count = internal_above_80 = internal_above_50 = 0
+
+    for t, p in cracks:
+        if t == "Internal":
+            internal.append(p)
+            if p > 50:
+                internal_above_50 += 1
+                if p > 80:
+                    internal_above_80 += 1
+            if 50 <= p <= 80:
+                internal_50_80_count += 1
+        elif t == "External":
+            external.append(p)
+            if p >= 10:
+                all_ext_lt10 = False
+                if p >= 25:
+                    all_ext_lt25 = False
+                    if p >= 50:
+                        all_ext_lt50 = False
+        else:
+            if t == "Split":
+                has_split = True
+            continue
+        if p < 50:
+            num_lt50 += 1
+            if p < 25:
+                num_lt25 += 1
+
+    # Exactly sum(internal + external): builtin sum() rounds differently across Python versions
+    # (compensated from 3.12), and totals that land on 100/200/300% must rate as before.
+    total = sum(internal + external)
     has_three_internal_above_50 = internal_above_50 >= 3
 
-    if debug:
-        print(f"\nMETRICS DEBUG:")
-        print(f"Total: {total:.2f}%")
-        print(f"Internal cracks: {len(internal)}")
-        print(f"External cracks: {len(external)}")
-        print(f"Has split: {has_split}")
-        print(f"Internal 50-80%: {internal_50_80_count}")
-        print(f"Internal >80%: {internal_above_80}")
-        print(f"Internal >50%: {internal_above_50}")
+    if log.isEnabledFor(logging.DEBUG):
+        log.debug(
+            "Metrics: total=%.2f%% internal=%d external=%d split=%s "
+            "internal 50-80%%=%d internal >80%%=%d internal >50%%=%d",
+            total, len(internal), len(external), has_split,
+            internal_50_80_count, internal_above_80, internal_above_50,
+        )
 
     return Metrics(
         num_cracks=len(cracks),
@@ -79,33 +113,44 @@ def compute_metrics(cracks: List[Crack], debug: bool = False) -> Metrics:
         has_three_internal_above_50=has_three_internal_above_50
     )
 
-def assign_rating_from_metrics(m: Metrics) -> int:
-    if m.num_cracks == 0:
+@lru_cache(maxsize=128)
+def _rating_from_key(key: Tuple) -> int:
+    (num_cracks, total_pct, has_split,
+     num_lt25, num_lt50,
+     all_ext_lt10, all_ext_lt25, all_ext_lt50,
+     internal_50_80_count, internal_above_80,
+     has_three_internal_above_50) = key
+
+    if num_cracks == 0:
         return 0
-    if m.has_split:
+    if has_split:
         return 5
 
     # Rating 1
-    if m.total_pct <= 100 and m.num_lt25 == m.num_cracks and m.all_ext_lt10:
+    if total_pct <= 100 and num_lt25 == num_cracks and all_ext_lt10:
         return 1
 
     # Rating 4 triggers
-    if (m.total_pct > 300
-        or m.internal_above_80 >= 1
-        or m.has_three_internal_above_50
-        or not m.all_ext_lt50):
+    if (total_pct > 300
+        or internal_above_80 >= 1
+        or has_three_internal_above_50
+        or not all_ext_lt50):
         return 4
 
     # Rating 2
-    if m.total_pct <= 200 and m.num_lt50 == m.num_cracks and m.all_ext_lt25:
+    if total_pct <= 200 and num_lt50 == num_cracks and all_ext_lt25:
         return 2
 
     # Rating 3
-    if m.total_pct <= 300 and m.internal_50_80_count <= 2 and m.all_ext_lt50:
+    if total_pct <= 300 and internal_50_80_count <= 2 and all_ext_lt50:
         return 3
 
     return 4
 
+def assign_rating_from_metrics(m: Metrics) -> int:
+    # Called on every table refresh, usually with unchanged metrics.
+    return _rating_from_key(m.rating_key)
+
 def assign_iso23936_rating(cracks: List[Crack]) -> int:
     return assign_rating_from_metrics(compute_metrics(cracks))
 
@@ -1,18 +1,37 @@
-import base64
 import datetime as dt
 import json
+import os
 import re
 import zipfile
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Optional, Sequence, Tuple
+from typing import Dict, List, Optional, Sequence, Tuple
 
 from rating import Crack
 
+try:
+    import orjson  # optional: faster session (de)serialization
+except ImportError:
+    orjson = None
+
+try:
+    from ciso8601 import parse_datetime as _fromisoformat  # optional: faster timestamp parsing
+except ImportError:
+    _fromisoformat = dt.datetime.fromisoformat
+
+try:
+    import pybase64 as b64  # optional: SIMD base64 for snapshot blobs
+except ImportError:
+    import base64 as b64
+
 ## Major version change indicates breaking changes, Major.Minor.Patch
-APP_VERSION = "1.2.0" # new PRs require version bump
-SESSION_SCHEMA_VERSION = 1 ## Increment this version number when the session file format changes, it will break .orngd compatibility
+APP_VERSION = "1.3.0" # new PRs require version bump
+SESSION_SCHEMA_VERSION = 2 ## Increment this version number when the session file format changes, it will break .orngd compatibility
 SESSION_JSON_FILENAME = "session.json"
+SNAPSHOT_DIR = "snapshots"  # schema 2+: PNG snapshots stored as raw archive members
+JSON_STORE_THRESHOLD = 64 * 1024  # session.json payloads below this are not worth deflating
+_SLUG_RE = re.compile(r"[^A-Za-z0-9]+")
 
 
 class SessionFileError(Exception):
@@ -74,11 +93,11 @@ def _iso(dt_value: dt.datetime) -> str:
 def _parse_iso(value: Optional[str]) -> dt.datetime:
     if not value:
         return _now()
-    return dt.datetime.fromisoformat(value)
+    return _fromisoformat(value)
 
 
 def _slugify_name(name: str) -> str:
-    cleaned = re.sub(r"[^A-Za-z0-9]+", "-", name.strip())
+    cleaned = _SLUG_RE.sub("-", name.strip())
     return cleaned.strip("-") or "PROJECT"
 
 
@@ -102,6 +121,7 @@ def create_session_metadata(rdms_number: str, project_name: str, technician_name
 
 
 def _cracks_to_json(cracks: Sequence[Crack]) -> List[Tuple[str, float]]:
+    # float() turns numpy scalars into plain floats, which orjson (unlike stdlib json) requires.
     return [(ctype, float(length)) for ctype, length in cracks]
 
 
@@ -114,26 +134,32 @@ def _cracks_from_json(data: Sequence[Sequence]) -> List[Crack]:
     return cracks
 
 
-def _record_to_dict(record: SessionAnalysis) -> dict:
-    payload = {
+def _record_to_dict(record: SessionAnalysis, snapshot_ref: Optional[str] = None) -> dict:
+    return {
         "index": record.index,
         "image_name": record.image_name,
         "image_path": record.image_path,
         "completed_at": _iso(record.completed_at),
         "crack_count": record.crack_count,
-        "total_pct": record.total_pct,
+        "total_pct": float(record.total_pct),
         "rating": record.rating,
         "result": record.result,
         "cracks": _cracks_to_json(record.cracks),
-        "snapshot_png": None,
+        "snapshot_ref": snapshot_ref,
     }
-    if record.snapshot_png:
-        payload["snapshot_png"] = base64.b64encode(record.snapshot_png).decode("ascii")
-    return payload
 
 
-def _record_from_dict(data: dict) -> SessionAnalysis:
-    snapshot = data.get("snapshot_png")
+def _record_from_dict(data: dict, snapshots: Dict[str, bytes]) -> SessionAnalysis:
+    snapshot_png: Optional[bytes] = None
+    snapshot_ref = data.get("snapshot_ref")
+    if snapshot_ref:
+        try:
+            snapshot_png = snapshots[snapshot_ref]
+        except KeyError as exc:
+            raise SessionFileError(f"Session archive missing snapshot {snapshot_ref}") from exc
+    elif data.get("snapshot_png"):
+        # Schema 1 embedded the PNG as base64 inside session.json.
+        snapshot_png = b64.b64decode(data["snapshot_png"])
     return SessionAnalysis(
         index=int(data.get("index", 0)),
         image_name=str(data.get("image_name", "")),
@@ -144,7 +170,7 @@ def _record_from_dict(data: dict) -> SessionAnalysis:
         rating=int(data.get("rating", 0)),
         result=str(data.get("result", "")),
         cracks=_cracks_from_json(data.get("cracks", [])),
-        snapshot_png=base64.b64decode(snapshot) if snapshot else None,
+        snapshot_png=snapshot_png,
     )
 
 
@@ -174,10 +200,23 @@ def _metadata_from_dict(data: dict) -> SessionMetadata:
     )
 
 
+def _dumps_json(payload: dict) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(payload, option=orjson.OPT_INDENT_2)
+    return json.dumps(payload, indent=2).encode("utf-8")
+
+
+def _loads_json(data: bytes) -> dict:
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
 def _ensure_path(path: str) -> Path:
-    return Path(path).expanduser().resolve()
+    return Path(os.path.abspath(os.path.expanduser(path)))
 
 
+@lru_cache(maxsize=32)
 def _parse_version(value: str) -> Tuple[int, int, int]:
     try:
         parts = [int(part) for part in value.split(".")[:3]]
@@ -188,18 +227,35 @@ def _parse_version(value: str) -> Tuple[int, int, int]:
     return tuple(parts)  # type: ignore[return-value]
 
 
+_CURRENT_MAJOR = _parse_version(APP_VERSION)[0]
+
+
 def save_session_file(path: str, metadata: SessionMetadata, records: List[SessionAnalysis]) -> None:
     output_path = _ensure_path(path)
     metadata.updated_at = _now()
-    payload = {
-        "schema_version": SESSION_SCHEMA_VERSION,
-        "app_version": APP_VERSION,
-        "metadata": _metadata_to_dict(metadata),
-        "analyses": [_record_to_dict(record) for record in records],
-    }
     try:
-        with zipfile.ZipFile(output_path, mode="w", compression=zipfile.ZIP_DEFLATED) as zf:
-            zf.writestr(SESSION_JSON_FILENAME, json.dumps(payload, indent=2).encode("utf-8"))
+        with zipfile.ZipFile(
+            output_path, mode="w", compression=zipfile.ZIP_DEFLATED, compresslevel=1
+        ) as zf:
+            analyses = []
+            for position, record in enumerate(records, start=1):
+                snapshot_ref = None
+                if record.snapshot_png:
+                    # PNG data is already deflated; store it as-is rather than base64 in the JSON.
+                    snapshot_ref = f"{SNAPSHOT_DIR}/{position:06d}.png"
+                    zf.writestr(snapshot_ref, record.snapshot_png, compress_type=zipfile.ZIP_STORED)
+                analyses.append(_record_to_dict(record, snapshot_ref))
+            payload = {
+                "schema_version": SESSION_SCHEMA_VERSION,
+                "app_version": APP_VERSION,
+                "metadata": _metadata_to_dict(metadata),
+                "analyses": analyses,
+            }
+            json_bytes = _dumps_json(payload)
+            json_compression = (
+                zipfile.ZIP_STORED if len(json_bytes) < JSON_STORE_THRESHOLD else zipfile.ZIP_DEFLATED
+            )
+            zf.writestr(SESSION_JSON_FILENAME, json_bytes, compress_type=json_compression)
     except OSError as exc:
         raise SessionFileError(f"Failed to write session file: {exc}") from exc
 
@@ -208,12 +264,18 @@ def load_session_file(path: str) -> SessionState:
     input_path = _ensure_path(path)
     try:
         with zipfile.ZipFile(input_path, mode="r") as zf:
-            with zf.open(SESSION_JSON_FILENAME) as fp:
-                payload = json.load(fp)
+            payload = _loads_json(zf.read(SESSION_JSON_FILENAME))
+            snapshots = {
+                name: zf.read(name)
+                for name in zf.namelist()
+                if name.startswith(f"{SNAPSHOT_DIR}/")
+            }
     except FileNotFoundError as exc:
         raise SessionFileError(f"Session file not found: {path}") from exc
     except KeyError as exc:
         raise SessionFileError("Session archive missing session.json") from exc
+    except zipfile.BadZipFile as exc:
+        raise SessionFileError(f"Not a valid session archive: {path}") from exc
     except (OSError, json.JSONDecodeError) as exc:
         raise SessionFileError(f"Failed to read session file: {exc}") from exc
 
@@ -225,14 +287,13 @@ def load_session_file(path: str) -> SessionState:
 
     file_version = str(payload.get("app_version", APP_VERSION))
     file_major, _, _ = _parse_version(file_version)
-    current_major, _, _ = _parse_version(APP_VERSION)
-    if file_major > current_major:
+    if file_major > _CURRENT_MAJOR:
         raise SessionVersionError(
             "Session file was created with a newer major version of oRinGD. Please update the app."
         )
 
     metadata = _metadata_from_dict(payload.get("metadata", {}))
-    analyses = [_record_from_dict(item) for item in payload.get("analyses", [])]
+    analyses = [_record_from_dict(item, snapshots) for item in payload.get("analyses", [])]
     for idx, record in enumerate(analyses, start=1):
         record.index = idx
 
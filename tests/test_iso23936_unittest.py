@@ -92,6 +92,22 @@ class TestISO23936Rating(unittest.TestCase):
             "Three internals at 50% default to Rating 4 (no pass conditions met)"
         )
 
+    def test_total_boundaries(self):
+        """Totals landing exactly on 100/200/300% and builtin-sum rounding"""
+        self.assertEqual(assign_iso23936_rating([("Internal", 20.0), ("External", 5.0)] * 4), 1)
+        self.assertEqual(assign_iso23936_rating([("Internal", 40.0)] * 5), 2)
+        self.assertEqual(assign_iso23936_rating([("Internal", 30.0)] * 10), 3)
+
+        # Decimal lengths summing to ~100%: the total must be sum(internal + external),
+        # whatever rounding this Python's sum() applies, and the rating must follow it.
+        internal = [17.55, 19.92, 11.55, 23.12, 11.34, 10.01]
+        external = [6.51]
+        cracks = [("Internal", p) for p in internal[:3]] + [("External", external[0])] \
+            + [("Internal", p) for p in internal[3:]]
+        expected_total = sum(internal + external)
+        self.assertEqual(compute_metrics(cracks).total_pct, expected_total)
+        self.assertEqual(assign_iso23936_rating(cracks), 1 if expected_total <= 100 else 2)
+
     def test_metrics_calculation(self):
         """Metrics integrity"""
         cracks = [("Internal", 75.0), ("External", 25.0), ("Internal", 30.0)]
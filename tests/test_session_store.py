@@ -1,14 +1,32 @@
+"""
+tests/test_session_store.py
+===========================
+Session archive save/load and version-compatibility tests.
+
+Each test builds its own session metadata (saving stamps updated_at on it) and
+writes to its own file in the class scratch directory.
+"""
+
+import dataclasses
 import datetime
+import io
 import json
 import os
 import tempfile
 import unittest
 import zipfile
+from functools import lru_cache
+from typing import Dict, Tuple
+from unittest import mock
 
+import numpy as np
+
+import session_store
 from session_store import (
     APP_VERSION,
     SESSION_SCHEMA_VERSION,
     SessionAnalysis,
+    SessionFileError,
     SessionVersionError,
     create_session_metadata,
     generate_project_code,
@@ -16,44 +34,71 @@ from session_store import (
     save_session_file,
 )
 
+FIXTURES_DIR = os.path.dirname(os.path.abspath(__file__))
 
-def _write_session_archive(directory: str, *, schema_version: int, app_version: str) -> str:
-    """Create a synthetic `.orngd` file for compatibility tests."""
+# Prefer a RAM-backed scratch area where one exists; tempfile's default location otherwise.
+_TMP_ROOT = "/dev/shm" if os.path.isdir("/dev/shm") and os.access("/dev/shm", os.W_OK) else None
+
+# Archive bytes keyed by (schema_version, app_version); the payload only varies in those two fields.
+_ARCHIVE_CACHE: Dict[Tuple[int, str], bytes] = {}
+
+# Shared by every synthetic archive; only the version fields are patched per archive.
+_BASE_PAYLOAD = {
+    "metadata": {
+        "rdms_project_number": "55555",
+        "project_name": "Legacy Session",
+        "technician_name": "Test Tech",
+        "project_code": "RT-55555_Legacy_20250201",
+        "created_at": "2025-02-01T10:00:00",
+        "updated_at": "2025-02-01T10:05:00",
+    },
+    "analyses": [
+        {
+            "index": 1,
+            "image_name": "legacy.png",
+            "image_path": "C:/data/legacy.png",
+            "completed_at": "2025-02-01T10:04:00",
+            "crack_count": 1,
+            "total_pct": 45.0,
+            "rating": 2,
+            "result": "Pass",
+            "cracks": [["Internal", 45.0]],
+            "snapshot_png": None,
+        }
+    ],
+}
+
+
+def _session_archive_bytes(schema_version: int, app_version: str) -> bytes:
+    key = (schema_version, app_version)
+    cached = _ARCHIVE_CACHE.get(key)
+    if cached is not None:
+        return cached
+
+    versions = {"schema_version": schema_version, "app_version": app_version}
     payload = {
-        "schema_version": schema_version,
-        "app_version": app_version,
-        "metadata": {
-            "rdms_project_number": "55555",
-            "project_name": "Legacy Session",
-            "technician_name": "Test Tech",
-            "project_code": "RT-55555_Legacy_20250201",
-            "created_at": "2025-02-01T10:00:00",
-            "updated_at": "2025-02-01T10:05:00",
-            "schema_version": schema_version,
-            "app_version": app_version,
-        },
-        "analyses": [
-            {
-                "index": 1,
-                "image_name": "legacy.png",
-                "image_path": "C:/data/legacy.png",
-                "completed_at": "2025-02-01T10:04:00",
-                "crack_count": 1,
-                "total_pct": 45.0,
-                "rating": 2,
-                "result": "Pass",
-                "cracks": [["Internal", 45.0]],
-                "snapshot_png": None,
-            }
-        ],
+        **versions,
+        "metadata": {**_BASE_PAYLOAD["metadata"], **versions},
+        "analyses": _BASE_PAYLOAD["analyses"],
     }
 
+    buffer = io.BytesIO()
+    # Small session.json members are stored uncompressed, as save_session_file does.
+    with zipfile.ZipFile(buffer, mode="w", compression=zipfile.ZIP_STORED) as zf:
+        zf.writestr("session.json", json.dumps(payload, separators=(",", ":")).encode("utf-8"))
+    _ARCHIVE_CACHE[key] = buffer.getvalue()
+    return _ARCHIVE_CACHE[key]
+
+
+def _write_session_archive(directory: str, *, schema_version: int, app_version: str) -> str:
+    """Create a synthetic `.orngd` file for compatibility tests."""
     archive_path = os.path.join(directory, f"schema_{schema_version}_app_{app_version}.orngd")
-    with zipfile.ZipFile(archive_path, mode="w", compression=zipfile.ZIP_DEFLATED) as zf:
-        zf.writestr("session.json", json.dumps(payload, indent=2).encode("utf-8"))
+    with open(archive_path, "wb") as fh:
+        fh.write(_session_archive_bytes(schema_version, app_version))
     return archive_path
 
 
+@lru_cache(maxsize=None)
 def _bump_version(version: str, part: str) -> str:
     parts = [int(piece) for piece in version.split(".")]
     while len(parts) < 3:
@@ -71,14 +116,13 @@ def _bump_version(version: str, part: str) -> str:
 
 
 class SessionStoreTests(unittest.TestCase):
-    def test_generate_project_code_format(self):
-        fake_date = datetime.datetime(2025, 1, 15)
-        code = generate_project_code("98765", "Project Alpha", fake_date)
-        self.assertTrue(code.startswith("RT-98765_Project-Alpha_20250115"))
-
-    def test_round_trip_save_and_load(self):
-        metadata = create_session_metadata("12345", "Hydrogen Analysis", "Dr. Ada")
-        record = SessionAnalysis(
+    @classmethod
+    def setUpClass(cls):
+        # One scratch directory for the class; tests use distinct file names inside it.
+        cls._tmp = tempfile.TemporaryDirectory(dir=_TMP_ROOT)
+        cls.tmpdir = cls._tmp.name
+        # Template record; tests derive variants with dataclasses.replace() rather than mutating it.
+        cls.sample_record = SessionAnalysis(
             index=1,
             image_name="sample.png",
             image_path="/tmp/sample.png",
@@ -90,11 +134,36 @@ class SessionStoreTests(unittest.TestCase):
             cracks=[("Internal", 75.0), ("External", 25.0)],
             snapshot_png=b"demo-bytes",
         )
+        # Compatibility archives are read-only inputs, so each is written once for the class.
+        cls.archives = {
+            name: _write_session_archive(cls.tmpdir, schema_version=schema, app_version=app)
+            for name, schema, app in (
+                ("legacy", SESSION_SCHEMA_VERSION, "1.0.0"),
+                ("minor", SESSION_SCHEMA_VERSION, _bump_version(APP_VERSION, "minor")),
+                ("major", SESSION_SCHEMA_VERSION, _bump_version(APP_VERSION, "major")),
+                ("schema", SESSION_SCHEMA_VERSION + 1, APP_VERSION),
+            )
+        }
 
-        with tempfile.TemporaryDirectory() as tmpdir:
-            file_path = os.path.join(tmpdir, "round-trip.orngd")
-            save_session_file(file_path, metadata, [record])
-            state = load_session_file(file_path)
+    @classmethod
+    def tearDownClass(cls):
+        cls._tmp.cleanup()
+
+    def _tmp_path(self, suffix: str = ".orngd") -> str:
+        return os.path.join(self.tmpdir, self.id().rsplit(".", 1)[-1] + suffix)
+
+    def _make_metadata(self, project_name: str = "Hydrogen Analysis"):
+        return create_session_metadata("12345", project_name, "Dr. Ada")
+
+    def test_generate_project_code_format(self):
+        fake_date = datetime.datetime(2025, 1, 15)
+        code = generate_project_code("98765", "Project Alpha", fake_date)
+        self.assertTrue(code.startswith("RT-98765_Project-Alpha_20250115"))
+
+    def test_round_trip_save_and_load(self):
+        file_path = self._tmp_path()
+        save_session_file(file_path, self._make_metadata(), [self.sample_record])
+        state = load_session_file(file_path)
 
         self.assertEqual(state.metadata.rdms_project_number, "12345")
         self.assertEqual(len(state.records), 1)
@@ -105,52 +174,125 @@ class SessionStoreTests(unittest.TestCase):
         self.assertEqual(loaded_record.cracks[0][1], 75.0)
         self.assertEqual(loaded_record.snapshot_png, b"demo-bytes")
 
+    def test_snapshots_stored_as_archive_members(self):
+        metadata = self._make_metadata("Snapshot Layout")
+        record = dataclasses.replace(self.sample_record, snapshot_png=b"\x89PNG-demo")
+
+        file_path = self._tmp_path()
+        save_session_file(file_path, metadata, [record])
+        with zipfile.ZipFile(file_path) as zf:
+            payload = json.loads(zf.read("session.json"))
+            ref = payload["analyses"][0]["snapshot_ref"]
+            self.assertEqual(zf.read(ref), b"\x89PNG-demo")
+            self.assertEqual(zf.getinfo(ref).compress_type, zipfile.ZIP_STORED)
+            self.assertEqual(zf.getinfo("session.json").compress_type, zipfile.ZIP_STORED)
+
+        self.assertNotIn("snapshot_png", payload["analyses"][0])
+
+    def test_loads_schema_1_fixture_with_embedded_snapshots(self):
+        fixture = os.path.join(FIXTURES_DIR, "RT-4567_Export-Test_20251120.orngd")
+        state = load_session_file(fixture)
+
+        self.assertEqual(len(state.records), 2)
+        for record in state.records:
+            self.assertTrue(record.snapshot_png.startswith(b"\x89PNG"))
+
+    def test_loads_schema_2_fixture_with_snapshot_members(self):
+        # Golden schema 2 file: the schema 1 fixture above re-saved by app 1.3.0.
+        fixture = os.path.join(FIXTURES_DIR, "RT-4567_Export-Test_20251120_schema2.orngd")
+        with zipfile.ZipFile(fixture) as zf:
+            payload = json.loads(zf.read("session.json"))
+            members = set(zf.namelist())
+        self.assertEqual(payload["schema_version"], 2)
+        for analysis in payload["analyses"]:
+            self.assertNotIn("snapshot_png", analysis)
+            self.assertIn(analysis["snapshot_ref"], members)
+
+        state = load_session_file(fixture)
+        legacy = load_session_file(os.path.join(FIXTURES_DIR, "RT-4567_Export-Test_20251120.orngd"))
+
+        self.assertEqual(state.metadata.project_code, legacy.metadata.project_code)
+        self.assertEqual(len(state.records), 2)
+        for record, legacy_record in zip(state.records, legacy.records):
+            self.assertTrue(record.snapshot_png.startswith(b"\x89PNG"))
+            self.assertEqual(record.snapshot_png, legacy_record.snapshot_png)
+            self.assertEqual(record.cracks, legacy_record.cracks)
+            self.assertEqual(record.total_pct, legacy_record.total_pct)
+            self.assertEqual(record.rating, legacy_record.rating)
+
+    def test_round_trip_with_stdlib_json(self):
+        metadata = self._make_metadata("Fallback Check")
+        record = dataclasses.replace(
+            self.sample_record, crack_count=1, total_pct=12.5, rating=1, cracks=[("Internal", 12.5)]
+        )
+
+        with mock.patch.object(session_store, "orjson", None):
+            file_path = self._tmp_path()
+            save_session_file(file_path, metadata, [record])
+            state = load_session_file(file_path)
+
+        self.assertEqual(state.metadata.project_name, "Fallback Check")
+        self.assertEqual(state.records[0].cracks, [("Internal", 12.5)])
+
+    def test_crack_lengths_round_trip_exactly(self):
+        # Ratings switch at 25/50/80% boundaries, so stored lengths must not be rounded.
+        cracks = [("Internal", 24.999999999999996), ("External", 50.00000000000001), ("Split", 1 / 3)]
+        metadata = self._make_metadata("Precision")
+        record = dataclasses.replace(
+            self.sample_record,
+            crack_count=3,
+            total_pct=sum(length for _, length in cracks),
+            rating=4,
+            result="Fail",
+            cracks=cracks,
+        )
+
+        file_path = self._tmp_path()
+        save_session_file(file_path, metadata, [record])
+        state = load_session_file(file_path)
+
+        self.assertEqual(state.records[0].cracks, cracks)
+        self.assertEqual(state.records[0].total_pct, record.total_pct)
+
+    def test_numpy_scalars_saved_as_floats(self):
+        # Canvas lengths come out of numpy; orjson rejects numpy.float64 unless it is coerced.
+        cracks = [("Internal", np.float64(24.5)), ("External", np.float64(12.25))]
+        metadata = self._make_metadata("Numpy Scalars")
+        record = dataclasses.replace(self.sample_record, total_pct=np.float64(36.75), rating=2, cracks=cracks)
+
+        file_path = self._tmp_path()
+        save_session_file(file_path, metadata, [record])
+        state = load_session_file(file_path)
+
+        self.assertEqual(state.records[0].total_pct, 36.75)
+        self.assertEqual(state.records[0].cracks, [("Internal", 24.5), ("External", 12.25)])
+
+    def test_rejects_non_zip_file(self):
+        bogus = self._tmp_path()
+        with open(bogus, "wb") as fh:
+            fh.write(b"\x28\xb5\x2f\xfdnot a zip archive")
+        with self.assertRaises(SessionFileError):
+            load_session_file(bogus)
+
     def test_loads_legacy_session_archive(self):
-        with tempfile.TemporaryDirectory() as tmpdir:
-            legacy_file = _write_session_archive(
-                tmpdir,
-                schema_version=SESSION_SCHEMA_VERSION,
-                app_version="1.0.0",
-            )
-            state = load_session_file(legacy_file)
+        state = load_session_file(self.archives["legacy"])
 
         self.assertEqual(state.metadata.project_name, "Legacy Session")
         self.assertEqual(len(state.records), 1)
         self.assertEqual(state.records[0].crack_count, 1)
 
     def test_newer_minor_version_is_permitted(self):
-        with tempfile.TemporaryDirectory() as tmpdir:
-            compat_file = _write_session_archive(
-                tmpdir,
-                schema_version=SESSION_SCHEMA_VERSION,
-                app_version=_bump_version(APP_VERSION, "minor"),
-            )
-
-            state = load_session_file(compat_file)
+        state = load_session_file(self.archives["minor"])
 
         self.assertEqual(state.metadata.project_name, "Legacy Session")
 
     def test_newer_major_version_raises_version_error(self):
-        with tempfile.TemporaryDirectory() as tmpdir:
-            future_file = _write_session_archive(
-                tmpdir,
-                schema_version=SESSION_SCHEMA_VERSION,
-                app_version=_bump_version(APP_VERSION, "major"),
-            )
-
-            with self.assertRaises(SessionVersionError):
-                load_session_file(future_file)
+        with self.assertRaises(SessionVersionError):
+            load_session_file(self.archives["major"])
 
     def test_newer_schema_version_raises_version_error(self):
-        with tempfile.TemporaryDirectory() as tmpdir:
-            newer_schema_file = _write_session_archive(
-                tmpdir,
-                schema_version=SESSION_SCHEMA_VERSION + 1,
-                app_version=APP_VERSION,
-            )
-
-            with self.assertRaises(SessionVersionError):
-                load_session_file(newer_schema_file)
+        with self.assertRaises(SessionVersionError):
+            load_session_file(self.archives["schema"])
 
 
 if __name__ == "__main__":